@@ -2,14 +2,7 @@ from lxml import html
 import datetime
 import pytz
 
-from nbapredict.helpers.br_references import Team
-
-TEAM_NAME_TO_TEAM = {
-    member.value: member
-    for (_, member) in Team.__members__.items()
-}
-
-TEAM_NAME_TO_TEAM["NEW ORLEANS/OKLAHOMA CITY HORNETS"] = Team.NEW_ORLEANS_OKLAHOMA_CITY_HORNETS
+from nbapredict.helpers.br_references import TEAM_NAME_TO_TEAM
 
 
 def parse_start_time(formatted_date, formatted_time_of_day):
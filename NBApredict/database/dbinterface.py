@@ -79,12 +79,11 @@ class DBInterface:
             return mapped_tables
 
     def table_exists(self, tbl_name):
-        """Check if a table exists in the database; Return True if it exists and False otherwise."""
-        self.metadata.reflect(bind=self.engine)
-        if tbl_name in self.metadata.tables:
-            return True
-        else:
-            return False
+        """Check if a table exists in the database; Return True if it exists and False otherwise.
+
+        Asks the dialect about the single table rather than reflecting the whole database."""
+        with self.engine.connect() as conn:
+            return self.engine.dialect.has_table(conn, tbl_name)
 
     def create_tables(self):
         """Creates all tables which have been made or modified with the Base class of the DBInterface
@@ -158,7 +157,7 @@ class DBInterface:
 
     def drop_table(self, drop_tbl):
         """Drops the specified table from the database"""
-        self.metadata.reflect(bind=self.engine)
+        self.metadata.reflect(bind=self.engine, only=[drop_tbl])
         drop_tbls = self.metadata.tables[drop_tbl]
         drop_tbls.drop()
         self.metadata = MetaData(bind=self.engine)  # Updates the metadata to reflect changes
@@ -5,6 +5,7 @@ summaries
 
 from datetime import timedelta
 import pandas as pd
+from sqlalchemy import func
 
 
 def get_games_on_day(schedule, session, date):
@@ -27,13 +28,10 @@ def get_first_game_time_on_day(schedule, session, date):
         session: An instantiated session object
         date: The date to check for games
     """
-    games_on_day = get_games_on_day(schedule, session, date).subquery()
-    first_game = session.query(games_on_day).order_by(games_on_day.c.start_time).first()
-    if first_game:
-        first_game_time = first_game[1]
-        return first_game_time
-    else:
-        return None
+    next_day = date + timedelta(days=1)
+    # Returns None if there are no games on the day
+    return session.query(func.min(schedule.start_time)).\
+        filter(schedule.start_time > date, schedule.start_time < next_day).scalar()
 
 
 def get_spreads_for_date(odds_table, session, date):
@@ -6,6 +6,13 @@ from datetime import datetime
 from nbapredict.helpers import type
 from sqlalchemy import Integer, Float, String, DateTime, Boolean
 
+# Python types, by name or class, mapped to their SQLalchemy column types
+_PY_TO_SQL = {"integer": Integer, int: Integer,
+              "float": Float, float: Float,
+              "string": String, str: String,
+              "datetime": DateTime, datetime: DateTime,
+              "bool": Boolean, bool: Boolean}
+
 
 class DataOperator:
     """DataOperator takes scraped data in init, and uses its member functions to return manipulations of that data"""
@@ -42,20 +49,14 @@ class DataOperator:
         Returns:
             A dictionary formatted as key:py_type where the type can be integer, float, string, datetime, or none
         """
-        py_types_dict = {}
         if isinstance(self.data, dict):
-            tbl_keys = list(self.data.keys())
-            py_types = [type.get_type(self.data[key]) for key in tbl_keys]
-            py_types_dict = dict(zip(tbl_keys, py_types))
+            return {key: type.get_type(value) for key, value in self.data.items()}
         elif isinstance(self.data, list):
             if isinstance(self.data[0], dict):
-                data = self.data[0]
-                tbl_keys = list(data.keys())
-                py_types = [type.get_type(data[key]) for key in tbl_keys]
-                py_types_dict = dict(zip(tbl_keys, py_types))
+                return {key: type.get_type(value) for key, value in self.data[0].items()}
             else:
                 raise Exception("The data structure ({}) is not handled by _get_py_type".format(type(self.data)))
-        return py_types_dict
+        return {}
 
     @staticmethod
     def _py_type_to_sql_type(py_types):
@@ -63,30 +64,13 @@ class DataOperator:
 
         Raises:
             An exception if a py_type is not an integer, float, string, datetime, bool, or none
-
-        To-do:
-            * Change the logic into a switch statement
         """
-
-        sql_types = dict()
-        for key in py_types:
-            py_type = py_types[key]
-            if py_type == "integer" or py_type is int:
-                sql_types[key] = Integer
-            elif py_type == "float" or py_type is float:
-                sql_types[key] = Float
-            elif py_type == "string" or py_type is str:
-                sql_types[key] = String
-            elif py_type == "datetime" or py_type is datetime:
-                sql_types[key] = DateTime
-            elif py_type == "bool" or py_type is bool:
-                sql_types[key] = Boolean
-            elif py_type is None:
-                continue  # We continue here so as to not create a column for null values
-            else:
-                raise Exception("Error: py_type {} is not an integer, float, datetime,"
-                                " none, or string".format(py_types[key]))
-        return sql_types
+        try:
+            # None types are skipped so as to not create a column for null values
+            return {key: _PY_TO_SQL[py_type] for key, py_type in py_types.items() if py_type is not None}
+        except KeyError as err:
+            raise Exception("Error: py_type {} is not an integer, float, datetime,"
+                            " none, or string".format(err.args[0]))
 
     # Table modification functions
     def dict_to_rows(self):
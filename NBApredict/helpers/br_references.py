@@ -128,46 +128,19 @@ TEAM_ABBREVIATIONS_TO_TEAM = {
     'VAN': Team.VANCOUVER_GRIZZLIES,
 }
 
-team_to_team_abbreviation = {
-    "ATLANTA HAWKS": "ATL",
-    "BOSTON CELTICS": "BOS",
-    "BROOKLYN NETS": "BRK",
-    "CHARLOTTE HORNETS": "CHO",
-    "CHICAGO BULLS": "CHI",
-    "CLEVELAND CAVALIERS": "CLE",
-    "DALLAS MAVERICKS": "DAL",
-    "DENVER NUGGETS": "DEN",
-    "DETROIT PISTONS": "DET",
-    "GOLDEN STATE WARRIORS": "GSW",
-    "HOUSTON ROCKETS": "HOU",
-    "INDIANA PACERS": "IND",
-    "LOS ANGELES CLIPPERS": "LAC",
-    "LOS ANGELES LAKERS": "LAL",
-    "MEMPHIS GRIZZLIES": "MEM",
-    "MIAMI HEAT": "MIA",
-    "MILWAUKEE BUCKS": "MIL",
-    "MINNESOTA TIMBERWOLVES": "MIN",
-    "NEW ORLEANS PELICANS": "NOP",
-    "NEW YORK KNICKS": "NYK",
-    "OKLAHOMA CITY THUNDER": "OKC",
-    "ORLANDO MAGIC": "ORL",
-    "PHILADELPHIA 76ERS": "PHI",
-    "PHOENIX SUNS": "PHO",
-    "PORTLAND TRAIL BLAZERS": "POR",
-    "SACRAMENTO KINGS": "SAC",
-    "SAN ANTONIO SPURS": "SAS",
-    "TORONTO RAPTORS": "TOR",
-    "UTAH JAZZ": "UTA",
-    "WASHINGTON WIZARDS": "WAS",
-    
-    # DEPRECATED TEAMS
-    "CHARLOTTE BOBCATS": "CHA",
-    "NEW JERSEY NETS": "NJN",
-    "NEW ORLEANS HORNETS": "NOH",
-    "NEW ORLEANS/OKLAHOMA CITY HORNETS": "NOK",
-    "SEATTLE SUPERSONICS": "SEA",
-    "VANCOUVER GRIZZLIES": "VAN"
-}
+# The first abbreviation listed for a team is its current abbreviation (i.e. CHO rather than CHH for the Hornets)
+_team_to_first_abbreviation = {}
+for _abbreviation, _team in TEAM_ABBREVIATIONS_TO_TEAM.items():
+    _team_to_first_abbreviation.setdefault(_team, _abbreviation)
+
+# Keyed in Team order, so current teams come first followed by deprecated teams
+team_to_team_abbreviation = {team.value: _team_to_first_abbreviation[team] for team in Team}
+
+# Standard team names mapped to their Team member. A copy of the enum's own value map, so lookups skip Team(value)
+TEAM_NAME_TO_TEAM = dict(Team._value2member_map_)
+
+# Lower case team names mapped to the standard team name for case-insensitive lookups
+LOWER_TEAM_NAME_TO_TEAM_NAME = {team.value.lower(): team.value for team in Team}
 
 POSITION_ABBREVIATIONS_TO_POSITION = {
     "PG": Position.POINT_GUARD,
@@ -25,6 +25,7 @@ from nbapredict.database import getters
 from nbapredict.management import conversion
 from nbapredict.management.tables import predictions
 from nbapredict.models import four_factor_regression as ff_reg
+from nbapredict.predict import get
 
 
 def get_prediction(reg, pred_df):
@@ -41,9 +42,7 @@ def get_prediction(reg, pred_df):
 
 def get_team_name(team):
     """Match team to a standard team name and return the br_references standard team name."""
-    for team_name in br_references.Team:
-        if team.lower() == team_name.value.lower():
-            return team_name.value
+    return br_references.LOWER_TEAM_NAME_TO_TEAM_NAME.get(team.lower())
 
 
 # def create_prediction_df(home_tm, away_tm, ff_df):
@@ -82,10 +81,7 @@ def get_team_ff(team, ff_df, home):
     """
     ff_list = br_references.four_factors
     team_ff = ff_df[ff_df.team_name.str.lower() == team.lower()][ff_list]
-    if home:
-        team_ff = team_ff.rename(ff_reg.append_h, axis='columns')
-    else:
-        team_ff = team_ff.rename(ff_reg.append_a, axis='columns')
+    team_ff.columns = get.FF_H if home else get.FF_A
     return team_ff
 
 
@@ -104,15 +100,36 @@ def line_probability(prediction, line, std):
         The survival function or cumulative density function for the line in relation to the prediction
     """
     # ToDo: T-Distribution?
-    dist = stats.norm(loc=prediction, scale=std)
-    line_prediction = -1 * line
+    line_prediction = -line
 
     if prediction > line_prediction:
-        return dist.cdf(line_prediction), "cdf"
+        return stats.norm.cdf(line_prediction, loc=prediction, scale=std), "cdf"
     elif prediction < line_prediction:
-        return dist.sf(line_prediction), "sf"
+        return stats.norm.sf(line_prediction, loc=prediction, scale=std), "sf"
     elif prediction == line_prediction:
-        return 0.5  # If the predictions are equal, the cdf automatically equals 0.5
+        return 0.5, "cdf"  # If the predictions are equal, the cdf automatically equals 0.5
+
+
+def line_probabilities(predictions, lines, std):
+    """Vectorized line_probability() which calculates the CDF or SF of every line in a single call.
+
+    Args:
+        predictions: An array of predictions
+        lines: An array of the lines associated with the same games as predictions
+        std: The standard deviation of the residuals for the model used to make the predictions
+
+    Returns:
+        A tuple of an array of probabilities and an array of the function ("cdf" or "sf") used for each game. Equal
+        predictions and line predictions have a probability of 0.5 and a "cdf" function
+    """
+    predictions = np.asarray(predictions, dtype=float)
+    line_predictions = -1 * np.asarray(lines, dtype=float)
+    use_cdf = predictions >= line_predictions
+    probabilities = np.where(use_cdf,
+                             stats.norm.cdf(line_predictions, loc=predictions, scale=std),
+                             stats.norm.sf(line_predictions, loc=predictions, scale=std))
+    functions = np.where(use_cdf, "cdf", "sf")
+    return probabilities, functions
 
 
 def prediction_result_console_output(home_tm, away_tm, line, prediction, probability):
@@ -125,22 +142,7 @@ def prediction_result_console_output(home_tm, away_tm, line, prediction, probabi
         prediction: A prediction of the home team's margin of victory
         probability: The probability of the betting line as determined by a CDF or SF
     """
-    if prediction > 0:
-        print("The {} are projected to beat the {} by {} points".format(home_tm, away_tm, prediction))
-        if (-1 * line) < prediction:
-            print("If the model were true, the betting line's ({}) CDF, in relation to the prediction, would "
-                  "be realized {}% of the time".format(line, probability))
-        else:
-            print("If the model were true, the betting line's ({}) SF, in relation to the prediction, would "
-                  "be realized {}% of the time".format(line, probability))
-    if prediction < 0:
-        print("The {} are projected to lose to the {} by {} points".format(home_tm, away_tm, prediction))
-        if (-1 * line) < prediction:
-            print("If the model were true, the betting line's ({}) CDF, in relation to the prediction, would "
-                  "be realized {}% of the time".format(line, probability))
-        else:
-            print("If the model were true, the betting line's ({}) SF, in relation to the prediction, would "
-                  "be realized {}% of the time".format(line, probability))
+    get.console_output(home_tm, away_tm, line, prediction, probability)
 
 
 def insert_predictions(rows, session, pred_tbl, sched_tbl):
@@ -177,7 +179,7 @@ def insert_new_predictions(rows, session, pred_tbl, sched_tbl, odds_tbl):
     """
     row_objects = []
     existing_predictions = session.query(pred_tbl.home_team, pred_tbl.away_team, pred_tbl.start_time).all()
-    existing_predictions = [(game.home_team, game.away_team, game.start_time) for game in existing_predictions]
+    existing_predictions = {(game.home_team, game.away_team, game.start_time) for game in existing_predictions}
     for row in rows:
         game_identifier = (row["home_team"], row["away_team"], row["start_time"])
         if game_identifier in existing_predictions:
@@ -296,32 +298,46 @@ def predict_games_in_odds(session, regression, odds_tbl):
     return predictions
 
 
-def predict_games_on_day(database, session, games, console_out=False):
+def predict_games_on_day(database, session, games, league_year, console_out=False):
     """Take a SQLalchemy query object of games, and return a prediction for each game.
 
+    The predictions and line probabilities for every game are calculated in a single call each.
+
     ToDO: On day versus on date?
     Args:
         database: an instantiated DBInterface class from database.dbinterface.py
         session: A SQLalchemy session object
         games: a SQLalchemy query object of games containing start_time, home_tm, away_tm, and the spread
+        league_year: The league year of the games. The regression and four factors are taken from the same season
         console_out: A bool. True to print prediction outputs
     """
+    games = list(games)
+    if not games:
+        return []
+
+    team_stats_tbl, sched_tbl = database.get_table_mappings(["team_stats_{}".format(league_year),
+                                                             "sched_{}".format(league_year)])
+    regression = ff_reg.main(session, team_stats_tbl, sched_tbl)
+    std = np.std(regression.residuals)
+    ff_lookup = get.four_factors_lookup(database, league_year)
+
+    home_teams = [get_team_name(game.home_team) for game in games]
+    away_teams = [get_team_name(game.away_team) for game in games]
+    # If games don't contain spreads, pass a 0 line. If games are missing other data, function will break.
+    lines = [getattr(game, "spread", 0) for game in games]
+
+    pred_df = get.prediction_batch_df(list(zip(home_teams, away_teams)), ff_lookup)
+    game_predictions = np.asarray(regression.results.predict(pred_df))
+    probabilities, functions = line_probabilities(game_predictions, lines, std)
+
     results = []
-    regression = ff_reg.main(database=database, session=session, year=year)
-    try:
-        for game in games:
-            prediction = predict_game(database=database, session=session, regression=regression, home_tm=game.home_team,
-                                      away_tm=game.away_team, start_time=game.start_time, line=game.spread,
-                                      console_out=console_out)
-            results.append(prediction)
-    except AttributeError:
-        # If games doesn't contain spreads, catch the attribute error and pass a 0 line.
-        # If games is missing other data, function will break.
-        for game in games:
-            prediction = predict_game(database=database, session=session, regression=regression, home_tm=game.home_team,
-                                      away_tm=game.away_team, start_time=game.start_time, line=0,
-                                      console_out=console_out)
-            results.append(prediction)
+    for game, home_tm, away_tm, line, prediction, probability, function in zip(games, home_teams, away_teams, lines,
+                                                                                game_predictions, probabilities,
+                                                                                functions):
+        if console_out:
+            prediction_result_console_output(home_tm, away_tm, line, prediction, probability)
+        results.append({"start_time": game.start_time, "home_team": home_tm, "away_team": away_tm, "line": line,
+                        "prediction": prediction, "probability": probability, "function": function})
     return results
 
 
@@ -343,7 +359,7 @@ def predict_games_on_date(database, session, league_year, date, console_out):
     games_query = getters.get_spreads_for_date(odds_tbl, session, date)
     game_spreads = [game for game in games_query]
 
-    results = predict_games_on_day(database, session, game_spreads, console_out=console_out)
+    results = predict_games_on_day(database, session, game_spreads, league_year, console_out=console_out)
 
     prediction_tbl = "predictions_{}".format(league_year)
     data = DataOperator(results)
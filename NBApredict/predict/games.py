@@ -9,6 +9,9 @@ from nbapredict.configuration import Config
 import nbapredict.models.four_factor_regression as lm
 import nbapredict.database.dbinterface as dbinterface
 
+# Each game is only predicted once
+_PREDICTION_CONSTRAINT = {UniqueConstraint: ["start_time", "home_team", "away_team"]}
+
 
 def create_prediction_table(database, data, tbl_name):
     """Create a prediction table from the data and with the table name in the database.
@@ -25,12 +28,9 @@ def create_prediction_table(database, data, tbl_name):
     # Add new columns
     year = tbl_name[-4:]
     schedule_name = "sched_{}".format(year)
-    additional_cols = [{'game_id': [Integer, ForeignKey(schedule_name + ".id")]}, {"MOV": Integer}]
-    for col in additional_cols:
-        sql_types.update(col)
-    constraint = {UniqueConstraint: ["start_time", "home_team", "away_team"]}
+    sql_types.update({'game_id': [Integer, ForeignKey(schedule_name + ".id")], "MOV": Integer})
     # Map prediction table
-    database.map_table(tbl_name, sql_types, constraint)
+    database.map_table(tbl_name, sql_types, _PREDICTION_CONSTRAINT)
 
     # Get tables for relationships
     sched_tbl = database.get_table_mappings(schedule_name)
@@ -1,10 +1,34 @@
 """Funcs contains functions for generating predictions and their helper functions."""
+import numpy as np
 import pandas as pd
 
 import nbapredict.models.four_factor_regression as lm
 import nbapredict.helpers.br_references as br_references
 from nbapredict.database.manipulator import DataOperator
-import nbapredict.database.getters as getters
+
+
+FF_LIST = lm.four_factors_list()
+
+# Four factor column names with the home and away suffixes appended
+FF_H = [lm.append_h(factor) for factor in FF_LIST]
+FF_A = [lm.append_a(factor) for factor in FF_LIST]
+
+# Prediction data frames are column sorted. _PREDICTION_ORDER sorts a home + away + const row into that order
+_prediction_cols = FF_H + FF_A + ["const"]
+_PREDICTION_ORDER = sorted(range(len(_prediction_cols)), key=_prediction_cols.__getitem__)
+PREDICTION_COLUMNS = [_prediction_cols[i] for i in _PREDICTION_ORDER]
+
+# Console output templates keyed by (prediction > 0, line prediction < prediction)
+_BEAT_MSG = "The {} are projected to beat the {} by {} points\n"
+_LOSE_MSG = "The {} are projected to lose to the {} by {} points\n"
+_CDF_MSG = ("If the model were true, the betting line's ({}) CDF, in relation to the prediction, would "
+            "be realized {}% of the time")
+_SF_MSG = ("If the model were true, the betting line's ({}) SF, in relation to the prediction, would "
+           "be realized {}% of the time")
+_MSG_TEMPLATES = {(True, True): _BEAT_MSG + _CDF_MSG,
+                  (True, False): _BEAT_MSG + _SF_MSG,
+                  (False, True): _LOSE_MSG + _CDF_MSG,
+                  (False, False): _LOSE_MSG + _SF_MSG}
 
 
 def sample_prediction(database, session, ref_tbl, model):
@@ -22,7 +46,8 @@ def sample_prediction(database, session, ref_tbl, model):
     Returns:
         A DataOperator object initialized with a prediction from regression
     """
-    first_game_odds = session.query(ref_tbl).order_by(ref_tbl.start_time).first()
+    first_game_odds = session.query(ref_tbl.home_team, ref_tbl.away_team, ref_tbl.start_time).\
+        order_by(ref_tbl.start_time).first()
 
     home_tm = first_game_odds.home_team
     away_tm = first_game_odds.away_team
@@ -33,7 +58,8 @@ def sample_prediction(database, session, ref_tbl, model):
     return data
 
 
-def game_prediction(database, session, regression, home_tm, away_tm, start_time, year=2019, console_out=False):
+def game_prediction(database, session, regression, home_tm, away_tm, start_time, year=2019, ff_lookup=None,
+                    console_out=False):
     """Predict a game versus the line, and return the information in a dictionary.
 
     Use console out for human readable output if desired. Cdf is a cumulative density function. SF is a survival
@@ -51,16 +77,16 @@ def game_prediction(database, session, regression, home_tm, away_tm, start_time,
         away_tm: The away team
         line: The betting line
         year: The year to use stats from in predicting the game
+        ff_lookup: Optional dictionary of each team's four factors. Read with four_factors_lookup() if not specified
         console_out: If true, print the prediction results. Ignore otherwise
     """
     home_tm = team_name(home_tm)
     away_tm = team_name(away_tm)
 
-    # Get Misc stats for year
-    ff_list = lm.four_factors_list()
-    ff_df = getters.get_pandas_df_from_table(database, session, "misc_stats_{}".format(year), ff_list)
+    if ff_lookup is None:
+        ff_lookup = four_factors_lookup(database, year)
 
-    pred_df = prediction_df(home_tm, away_tm, ff_df)
+    pred_df = prediction_df(home_tm, away_tm, ff_lookup)
     pred = prediction(regression, pred_df)
     # probability, function = line_probability(prediction, line, np.std(regression.residuals))
 
@@ -70,6 +96,25 @@ def game_prediction(database, session, regression, home_tm, away_tm, start_time,
     return {"start_time": start_time, "home_team": home_tm, "away_team": away_tm, "prediction": pred}
 
 
+def four_factors_lookup(database, year):
+    """Return a dictionary of each team's four factors for year.
+
+    Only the team_name and four factor columns are selected from the misc_stats table. Read it once and pass it to
+    game_prediction() or prediction_batch_df() when predicting multiple games.
+
+    Args:
+        database: an instantiated DBInterface class from database.dbinterface.py
+        year: The year of the misc_stats table to read
+
+    Returns:
+        A dictionary keyed by lower case team names with an array of the team's four factors as values. The array is
+        ordered as FF_LIST
+    """
+    query = "SELECT team_name, {} FROM misc_stats_{}".format(", ".join(FF_LIST), year)
+    ff_df = pd.read_sql_query(query, database.engine)
+    return dict(zip(ff_df["team_name"].str.lower(), ff_df[FF_LIST].to_numpy()))
+
+
 def prediction(reg, pred_df):
     """Generate and return a prediction for the observations in the pred_df.
 
@@ -92,68 +137,45 @@ def console_output(home_tm, away_tm, line, prediction, probability):
         prediction: A prediction of the home team's margin of victory
         probability: The probability of the betting line as determined by a CDF or SF
     """
-    if prediction > 0:
-        print("The {} are projected to beat the {} by {} points".format(home_tm, away_tm, prediction))
-        if (-1 * line) < prediction:
-            print("If the model were true, the betting line's ({}) CDF, in relation to the prediction, would "
-                  "be realized {}% of the time".format(line, probability))
-        else:
-            print("If the model were true, the betting line's ({}) SF, in relation to the prediction, would "
-                  "be realized {}% of the time".format(line, probability))
-    if prediction < 0:
-        print("The {} are projected to lose to the {} by {} points".format(home_tm, away_tm, prediction))
-        if (-1 * line) < prediction:
-            print("If the model were true, the betting line's ({}) CDF, in relation to the prediction, would "
-                  "be realized {}% of the time".format(line, probability))
-        else:
-            print("If the model were true, the betting line's ({}) SF, in relation to the prediction, would "
-                  "be realized {}% of the time".format(line, probability))
-
-
-def prediction_df(home_tm, away_tm, ff_df):
+    # A prediction of 0 (or NaN) is neither a projected win nor loss, so nothing is printed
+    if prediction == 0 or np.isnan(prediction):
+        return
+    line_prediction = -line
+    template = _MSG_TEMPLATES[(prediction > 0, line_prediction < prediction)]
+    print(template.format(home_tm, away_tm, prediction, line, probability))
+
+
+def prediction_df(home_tm, away_tm, ff_lookup):
     """Create and return a dataframe that merges the four factors for the home and away team.
 
     Args:
         home_tm: The home team
         away_tm: The away team
-        ff_df: Dataframe of the four factors for all teams
+        ff_lookup: Dictionary of the four factors for all teams from four_factors_lookup()
 
     Returns:
         A single row four factors data frame of the home and away team's four factors
     """
-    home_ff = team_ff(home_tm, ff_df, home=True)
-    away_ff = team_ff(away_tm, ff_df, home=False)
-    home_ff["key"] = 1
-    home_ff["const"] = 1.0  # sm.add_const does not add a constant for whatever reason
-    away_ff["key"] = 1
-    merged = pd.merge(home_ff, away_ff, on="key", sort=True)
-    merged = merged.drop(["key"], axis=1)
-    merged = merged.sort_index(axis=1)
-    return merged
+    return prediction_batch_df([(home_tm, away_tm)], ff_lookup)
 
 
-def team_ff(team, ff_df, home):
-    """Create and return a data frame of the four factors for the specified team.
+def prediction_batch_df(matchups, ff_lookup):
+    """Create and return a dataframe with a row of the home and away team's four factors for each matchup.
 
     Args:
-        team: The team to extract the four factors for
-        ff_df: A dataframe of the four factors
-        home: Boolean which dictates if an '_h or '_a' should be appended to the team's stats
+        matchups: A list of (home team, away team) tuples
+        ff_lookup: Dictionary of the four factors for all teams from four_factors_lookup()
 
     Returns:
-        The four factors, with a home or away suffix, for a team are returned as a data frame
+        A four factors data frame with one row per matchup, in the same order as matchups
     """
-    ff_list = br_references.four_factors
-    team_ff = ff_df[ff_df.team_name.str.lower() == team.lower()][ff_list]
-    if home:
-        team_ff = team_ff.rename(lm.append_h, axis='columns')
-    else:
-        team_ff = team_ff.rename(lm.append_a, axis='columns')
-    return team_ff
+    home_ff = np.array([ff_lookup[home_tm.lower()] for home_tm, _ in matchups], dtype=float)
+    away_ff = np.array([ff_lookup[away_tm.lower()] for _, away_tm in matchups], dtype=float)
+    const = np.ones((len(matchups), 1))  # sm.add_const does not add a constant for whatever reason
+    rows = np.hstack((home_ff, away_ff, const))[:, _PREDICTION_ORDER]
+    return pd.DataFrame(rows, columns=PREDICTION_COLUMNS)
 
 
 def team_name(team):
     """Match team to a standard team name (not cap-sensitive) and return the br_references standard team name."""
-    for team_name in br_references.Team:
-        if team.lower() == team_name.value.lower():
-            return team_name.value
+    return br_references.LOWER_TEAM_NAME_TO_TEAM_NAME.get(team.lower())